@@ -3,6 +3,10 @@
 import os
 
 
+_BINARY = getattr(os, 'O_BINARY', 0)
+_CHUNK_SIZE = 65536
+
+
 def read_file(file_path):
     """ read a file as a string
 
@@ -11,9 +15,19 @@ def read_file(file_path):
     :return: file contents
     :rtype: str
     """
-    assert os.path.isfile(file_path)
-    with open(file_path, mode='r', encoding='utf-8') as file_obj:
-        file_str = file_obj.read()
+    fd_ = os.open(file_path, os.O_RDONLY | _BINARY)
+    try:
+        # size the first read to the whole file, then keep going until EOF
+        # in case the read came back short or the file grew
+        chunks = [os.read(fd_, os.fstat(fd_).st_size or _CHUNK_SIZE)]
+        while chunks[-1]:
+            chunks.append(os.read(fd_, _CHUNK_SIZE))
+    finally:
+        os.close(fd_)
+    file_str = b''.join(chunks).decode('utf-8')
+    # universal newlines, as for a file opened in text mode
+    if '\r' in file_str:
+        file_str = file_str.replace('\r\n', '\n').replace('\r', '\n')
     return file_str
 
 
@@ -25,5 +39,13 @@ def write_file(file_path, string):
     :param file_path: string to be written
     :type file_path: str
     """
-    with open(file_path, mode='w', encoding='utf-8') as file_obj:
-        file_obj.write(string)
+    if os.linesep != '\n':
+        string = string.replace('\n', os.linesep)
+    data = memoryview(string.encode('utf-8'))
+    fd_ = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _BINARY,
+                  0o666)
+    try:
+        while data:
+            data = data[os.write(fd_, data):]
+    finally:
+        os.close(fd_)
@@ -1,13 +1,22 @@
 """ defines the filesystem model
 """
 import os
-import glob
+import sys
 import types
+import functools
 import shutil
 import itertools
+from concurrent.futures import ThreadPoolExecutor
 import autofile.io_
 
 
+# the most directories a DataSeries chain remembers before starting over
+MAX_KNOWN_DIRS = 4096
+
+LOCATOR_READ_THREADS = 32
+_LOCATOR_READ_EXECUTOR = None
+
+
 class DataFile():
     """ file manager for a given datatype
 
@@ -22,7 +31,8 @@ class DataFile():
 
     """
     def __init__(self, name, writer_=(lambda _: _), reader_=(lambda _: _)):
-        self.name = name
+        self.name = sys.intern(name)
+        self._name_suffix = os.sep + self.name
         self.writer_ = writer_
         self.reader_ = reader_
         self.removable = False
@@ -35,6 +45,10 @@ class DataFile():
         :returns: datafile path
         :return type: str
         """
+        # file names never contain a separator, so plain concatenation
+        # matches os.path.join whenever the directory doesn't end in one
+        if dir_pth and not dir_pth.endswith(os.sep):
+            return dir_pth + self._name_suffix
         return os.path.join(dir_pth, self.name)
 
     def exists(self, dir_pth):
@@ -56,12 +70,13 @@ class DataFile():
         :param dir_pth: directory path
         :type dir_pth: str
         """
-        assert os.path.exists(dir_pth), (
-            f'No path exists: {dir_pth}'
-        )
         pth = self.path(dir_pth)
         val_str = self.writer_(val)
-        autofile.io_.write_file(pth, val_str)
+        # let the open report a missing directory, rather than checking first
+        try:
+            autofile.io_.write_file(pth, val_str)
+        except FileNotFoundError as err:
+            raise AssertionError(f'No path exists: {dir_pth}') from err
 
     def read(self, dir_pth):
         """ read data from this file
@@ -71,13 +86,15 @@ class DataFile():
         :returns: datafile contents
         :return type: int/float/str/tuple
         """
-        assert self.exists(dir_pth), (
-            f'Either requested file {self}',
-            f'or requested path does not exist {dir_pth}'
-        )
-
         pth = self.path(dir_pth)
-        val_str = autofile.io_.read_file(pth)
+        # let the open report a missing file, rather than checking first
+        try:
+            val_str = autofile.io_.read_file(pth)
+        except FileNotFoundError as err:
+            raise FileNotFoundError(
+                f'Either requested file {self} '
+                f'or requested path does not exist {dir_pth}'
+            ) from err
         val = self.reader_(val_str)
         return val
 
@@ -114,13 +131,24 @@ class DataSeries():
 
     def __init__(self, prefix, map_, nlocs, depth, loc_dfile=None,
                  root_ds=None, removable=False):
-        self.prefix = os.path.abspath(prefix)
+        # abspath also normalizes, so the prefix needs no per-call cleanup
+        self.prefix = sys.intern(os.path.abspath(prefix))
+        self._prefix_sep = os.path.join(self.prefix, '')
         self.map_ = map_
         self.nlocs = nlocs
         self.depth = depth
         self.loc_dfile = loc_dfile
         self.root = root_ds
         self.removable = removable
+        self._root_nlocs_total = (
+            0 if root_ds is None else
+            root_ds.nlocs + root_ds.root_locator_count())
+        self._path_cache = _memoized_path(self._compute_path)
+        self._walker = functools.partial(_walk_depth, depth=depth)
+        # directories whose locator files this chain has written; shared with
+        # the root so that a removal anywhere in the chain invalidates it
+        self._known_dirs = set() if root_ds is None else root_ds._known_dirs
+        self.files = {}
         self.file = types.SimpleNamespace()
         self.json_file = 'db.json'
         self.json = types.SimpleNamespace()
@@ -135,23 +163,35 @@ class DataSeries():
             assert isinstance(name, str)
             assert isinstance(dfile, DataFile)
             dsfile = DataSeriesFile(dseries=self, dfile=dfile)
+            # `files` is the name-keyed lookup; `file` keeps attribute access
+            self.files[name] = dsfile
             setattr(self.file, name, dsfile)
 
     def path(self, locs=()):
         """ absolute directory path
 
         """
+        return self._path_cache(locs)
+
+    def _compute_path(self, locs):
+        """ absolute directory path, uncached
+
+        """
+        # one length check covers the split between root and self below
+        assert len(locs) == self._root_nlocs_total + self.nlocs, (
+            f'{len(locs)} != {self._root_nlocs_total + self.nlocs}'
+        )
         if self.root is None:
-            prefix = self.prefix
+            prefix_sep = self._prefix_sep
         else:
             root_locs = self._root_locators(locs)
             locs = self._self_locators(locs)
-            prefix = self.root.path(root_locs)
-        assert len(locs) == self.nlocs
+            prefix_sep = self.root.path(root_locs) + os.sep
         pth = self.map_(locs)
-        assert _path_is_relative(pth)
-        assert _path_has_depth(pth, self.depth)
-        return os.path.join(prefix, pth)
+        if __debug__:
+            assert _path_is_relative(pth)
+            assert _path_has_depth(pth, self.depth)
+        return prefix_sep + pth
 
     def exists(self, locs=()):
         """ does this directory exist?
@@ -168,6 +208,7 @@ class DataSeries():
         """
         if self.removable:
             pth = self.path(locs)
+            self._known_dirs.clear()
             if self.exists(locs):
                 shutil.rmtree(pth)
         else:
@@ -176,27 +217,27 @@ class DataSeries():
     def create(self, locs=()):
         """ create a directory at this prefix
 
-        """
-        # recursively create starting from the first root directory
-        if self.root is not None:
-            root_locs = self._root_locators(locs)
-            self.root.create(root_locs)
-
-        # create this directory in the chain, if it doesn't already exist
-        if not self.exists(locs):
-            pth = self.path(locs)
-            os.makedirs(pth, exist_ok=True)
-
-            if self.loc_dfile is not None:
-                locs = self._self_locators(locs)
-                self.loc_dfile.write(locs, pth)
-        if self.loc_dfile is not None:
-            try:
-                pth = self.path(locs)
-                locs = self._self_locators(locs)
-                self.loc_dfile.write(locs, pth)
-            except AssertionError:
-                pass
+        Directories whose locator files this chain has already written are
+        remembered, so a repeat create skips rewriting them. A locator file
+        deleted by hand from such a directory is therefore not restored by
+        this manager; a fresh one (as autofile.fs builds on every call) will
+        write it again.
+        """
+        # walk the chain from the first root directory down, always going to
+        # the filesystem, since another manager (or anything else) may have
+        # removed part of it; the known directories only let us skip
+        # rewriting locator files that are already in place
+        for dseries, dseries_locs, dseries_pth in self._ancestor_paths(locs):
+            if (not _make_directory(dseries_pth)
+                    and dseries_pth in self._known_dirs):
+                continue
+
+            if dseries.loc_dfile is not None:
+                self_locs = dseries_locs[dseries.root_locator_count():]
+                dseries.loc_dfile.write(self_locs, dseries_pth)
+            if len(self._known_dirs) >= MAX_KNOWN_DIRS:
+                self._known_dirs.clear()
+            self._known_dirs.add(dseries_pth)
 
     def existing(self, root_locs=(), relative=False, ignore_bad_formats=True):
         """ return the list of locators for existing paths
@@ -226,38 +267,67 @@ class DataSeries():
                     self.existing(root_locs_)
                     for root_locs_ in self.root.existing(root_locs))))
             else:
-                assert root_nlocs == len(root_locs), (
-                    f'{root_nlocs} != {len(root_locs)}'
-                )
-                pths = self._existing_paths(root_locs)
-                if ignore_bad_formats:
-                    locs_lst = []
-                    for pth in pths:
-                        if self.loc_dfile.exists(pth):
-                            try:
-                                pth_loc = self.loc_dfile.read(pth)
-                                locs_lst.append(pth_loc)
-                            except ValueError as exception:
-                                print(
-                                    'currently allowing ' +
-                                    f'exception {exception}' +
-                                    ' in existing to avoid crashes from' +
-                                    '  CONF/cid in RUN')
-                            except KeyError as exception:
-                                print(
-                                    'currently allowing ' +
-                                    f'exception {exception}' +
-                                    ' in existing to avoid crashes from' +
-                                    '  CONF/cid in RUN')
-                else:
-                    locs_lst = tuple(self.loc_dfile.read(pth) for pth in pths
-                                     if self.loc_dfile.exists(pth))
+                pths = self.existing_paths(root_locs)
+                # the locator files are independent, so read them across
+                # threads; map() keeps the results in path order
+                results = tuple(_locator_read_executor().map(
+                    self._read_locators, pths))
+                locs_lst = []
+                for found, pth_loc, exception in results:
+                    if exception is not None:
+                        if not ignore_bad_formats:
+                            raise exception
+                        print(
+                            'currently allowing ' +
+                            f'exception {exception}' +
+                            ' in existing to avoid crashes from' +
+                            '  CONF/cid in RUN')
+                    elif found:
+                        locs_lst.append(pth_loc)
+                if not ignore_bad_formats:
+                    locs_lst = tuple(locs_lst)
 
                 if not relative:
                     locs_lst = tuple(map(list(root_locs).__add__, locs_lst))
 
         return locs_lst
 
+    def existing_paths(self, root_locs=()):
+        """ return the directory paths at this level of the series
+
+        (these come straight from the directory listing, without reading the
+        locator files, so directories lacking a locator file are included)
+        """
+        root_nlocs = self.root_locator_count()
+
+        # Recursion for when we have a root DataSeries
+        if len(root_locs) < root_nlocs:
+            return tuple(itertools.chain(*(
+                self.existing_paths(root_locs_)
+                for root_locs_ in self.root.existing(root_locs))))
+
+        assert root_nlocs == len(root_locs), (
+            f'{root_nlocs} != {len(root_locs)}'
+        )
+        if self.nlocs == 0:
+            pth = self.path(root_locs)
+            return (pth,) if os.path.isdir(pth) else ()
+        return self._existing_paths(root_locs)
+
+    def _read_locators(self, pth):
+        """ read the locators from the locator file in a directory
+
+        :returns: whether the file was found, the locators, and the
+            formatting error raised while reading them (if any)
+        :rtype: (bool, list, Exception)
+        """
+        try:
+            return True, self.loc_dfile.read(pth), None
+        except FileNotFoundError:
+            return False, None, None
+        except (ValueError, KeyError) as exception:
+            return True, None, exception
+
     def _existing_paths(self, root_locs=()):
         """ existing paths at this prefix/root directory
 
@@ -267,9 +337,7 @@ class DataSeries():
         else:
             prefix = self.root.path(root_locs)
 
-        pth_pattern = os.path.join(prefix, *('*' * self.depth))
-        pths = filter(os.path.isdir, glob.glob(pth_pattern))
-        pths = tuple(sorted(os.path.join(prefix, pth) for pth in pths))
+        pths = tuple(sorted(self._walker(prefix)))
         return pths
 
     def json_path(self, json_layer=None):
@@ -347,33 +415,42 @@ class DataSeries():
     def root_locator_count(self):
         """ count the number of root locator values recursively
 
+        (the root chain is fixed at construction, so this is cached there)
         """
-        if self.root is None:
-            root_nlocs = 0
-        else:
-            root_nlocs = self.root.nlocs + self.root.root_locator_count()
-        return root_nlocs
+        return self._root_nlocs_total
 
     # helpers
+    def _ancestor_paths(self, locs):
+        """ the DataSeries in the root chain, with their locators and paths
+
+        :returns: (DataSeries, locators, path) triples, from the first root
+            down to this one
+        :rtype: list
+        """
+        chain = []
+        dseries = self
+        while dseries is not None:
+            chain.append((dseries, locs, dseries.path(locs)))
+            locs = locs[:dseries.root_locator_count()]
+            dseries = dseries.root
+        return chain[::-1]
+
     def _self_locators(self, locs):
         """ locators for this DataSeriesDir
 
         """
-        nlocs = len(locs)
-        assert nlocs >= self.nlocs
-        root_nlocs = nlocs - self.nlocs
-        return locs[root_nlocs:]
+        # with no root locators, these are all ours; skip the copy
+        if not self._root_nlocs_total:
+            return locs
+        return locs[self._root_nlocs_total:]
 
     def _root_locators(self, locs):
         """ locators for the root DataSeriesDir, if there is one
 
         """
-        nlocs = len(locs)
-        assert nlocs >= self.nlocs, (
-            f'{nlocs} != {self.nlocs}'
-        )
-        root_nlocs = nlocs - self.nlocs
-        return locs[:root_nlocs]
+        if not self._root_nlocs_total:
+            return ()
+        return locs[:self._root_nlocs_total]
 
     def __repr__(self):
         """ represent this object as a string
@@ -387,14 +464,23 @@ class DataSeriesFile():
 
     """
 
+    __slots__ = ('dir', 'file', 'removable', '_path_cache')
+
     def __init__(self, dseries, dfile):
         self.dir = dseries
         self.file = dfile
         self.removable = False
+        self._path_cache = _memoized_path(self._compute_path)
 
     def path(self, locs=()):
         """ absolute file path
 
+        """
+        return self._path_cache(locs)
+
+    def _compute_path(self, locs):
+        """ absolute file path, uncached
+
         """
         return self.file.path(self.dir.path(locs))
 
@@ -416,6 +502,18 @@ class DataSeriesFile():
         """
         return self.file.read(self.dir.path(locs))
 
+    def try_read(self, locs=()):
+        """ read data from this file, if it exists
+
+        (a single open, in place of checking `exists` before a `read`)
+
+        :returns: datafile contents, or None if the file doesn't exist
+        """
+        try:
+            return self.read(locs)
+        except FileNotFoundError:
+            return None
+
     def remove(self, locs=()):
         """ remove this file
 
@@ -661,35 +759,162 @@ class JSONEntry():
         return ret
 
 
+def _locator_read_executor():
+    """ the thread pool shared by all locator file reads
+
+    (started on first use and reused afterwards, so that each call to
+    `existing` doesn't pay for spinning up its own threads)
+    """
+    global _LOCATOR_READ_EXECUTOR
+    if _LOCATOR_READ_EXECUTOR is None:
+        _LOCATOR_READ_EXECUTOR = ThreadPoolExecutor(
+            max_workers=LOCATOR_READ_THREADS)
+    return _LOCATOR_READ_EXECUTOR
+
+
+def _reset_locator_read_executor():
+    """ drop the shared thread pool
+
+    (a forked child doesn't inherit the pool's threads, so it must start its
+    own)
+    """
+    global _LOCATOR_READ_EXECUTOR
+    _LOCATOR_READ_EXECUTOR = None
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_locator_read_executor)
+
+
+def _memoized_path(path_):
+    """ wrap a path function of the locators in an LRU cache
+
+    The cache is keyed on a frozen copy of the locators, so those holding
+    lists or dicts (such as reaction or constrained scan locators) are cached
+    too. Locators that can't be frozen into a hashable key bypass the cache.
+
+    :param path_: the uncached path function
+    :type path_: callable[list->str]
+    :returns: the cached path function
+    :rtype: callable[list->str]
+    """
+    @functools.lru_cache(maxsize=256)
+    def _path_from_key(key):
+        return path_(_thaw_locators(key))
+
+    def _path(locs):
+        key = _freeze_locators(locs)
+        try:
+            hash(key)
+        except TypeError:
+            return path_(locs)
+        return _path_from_key(key)
+
+    return _path
+
+
+def _freeze_locators(locs):
+    """ freeze locator values into a hashable key
+
+    Each value is tagged with its type, so that `1` and `1.0` (which map to
+    different paths) get different keys and the values can be thawed back
+    exactly.
+    """
+    typ = type(locs)
+    if typ in (list, tuple):
+        return (typ, tuple(map(_freeze_locators, locs)))
+    if typ is dict:
+        return (typ, tuple((_freeze_locators(key), _freeze_locators(val))
+                           for key, val in locs.items()))
+    return (typ, locs)
+
+
+def _thaw_locators(key):
+    """ recover locator values from a key made by `_freeze_locators`
+    """
+    typ, val = key
+    if typ in (list, tuple):
+        return typ(map(_thaw_locators, val))
+    if typ is dict:
+        return {_thaw_locators(k): _thaw_locators(v) for k, v in val}
+    return val
+
+
+def _make_directory(pth):
+    """ create a directory, along with any missing parents
+
+    (a single `mkdir` when the parent exists, as it does when a chain is
+    created from the top down)
+
+    :param pth: the directory path
+    :type pth: str
+    :returns: whether the directory had to be created
+    :rtype: bool
+    """
+    try:
+        os.mkdir(pth)
+    except FileExistsError:
+        return False
+    except FileNotFoundError:
+        os.makedirs(pth, exist_ok=True)
+    return True
+
+
+def _walk_depth(prefix, depth):
+    """ walk the directories exactly `depth` levels below a prefix
+
+    Uses `os.scandir` so that the directory checks come from the cached
+    directory entries rather than an extra `stat` per path. Like `glob`,
+    hidden entries are skipped and directories that can't be listed yield
+    nothing.
+
+    :param prefix: the directory to start from
+    :type prefix: str
+    :param depth: the number of directory levels to descend
+    :type depth: int
+    :returns: paths to the directories at this depth
+    :rtype: list of str
+    """
+    # expand one level at a time, so a depth-one series costs a single
+    # listing and deep series don't chain generators
+    pths = [prefix]
+    for _ in range(depth):
+        pths = [sub_pth for pth in pths for sub_pth in _subdirectories(pth)]
+    return pths
+
+
+def _subdirectories(pth):
+    """ paths to the (non-hidden) directories directly inside a directory
+
+    :param pth: the directory path
+    :type pth: str
+    :rtype: list of str
+    """
+    try:
+        with os.scandir(pth) as entries:
+            return [entry.path for entry in entries
+                    if not entry.name.startswith('.') and entry.is_dir()]
+    except OSError:
+        # like glob, skip anything that can't be listed (missing, not a
+        # directory, or unreadable)
+        return []
+
+
 def _path_is_relative(pth):
-    """ is this a relative path?
+    """ is this a normalized relative path (that stays below its prefix)?
 
+    (normalized, so that appending it to a prefix never doubles a separator)
     """
-    return os.path.relpath(pth) == pth
+    return (not os.path.isabs(pth)
+            and os.path.normpath(pth) == pth
+            and pth.split(os.sep, 1)[0] != os.pardir)
 
 
 def _path_has_depth(pth, depth):
-    """ does this path have the given depth?
+    """ does this (relative) path have the given depth?
 
     """
-    return len(_os_path_split_all(pth)) == depth
-
-
-def _os_path_split_all(pth):
-    """ grabbed this from the internet """
-
-    allparts = []
-    while 1:
-        parts = os.path.split(pth)
-        if parts[0] == pth:    # sentinel for absolute paths
-            allparts.insert(0, parts[0])
-            break
-        if parts[1] == pth:  # sentinel for relative paths
-            allparts.insert(0, parts[1])
-            break
-        pth = parts[0]
-        allparts.insert(0, parts[1])
-    return allparts
+    return pth.rstrip(os.sep).count(os.sep) + 1 == depth
 
 
 def _remove_layer_from_path(path, json_layer):
@@ -2,9 +2,11 @@
 """
 
 import os
+import shutil
 import tempfile
 import pytest
 import autofile.info
+import autofile.io_
 import autofile.schema
 
 
@@ -822,3 +824,186 @@ def test__data_series__build_trunk():
     for root_alocs in root_alocs_lst:
         assert (sorted(ds_.existing(root_alocs, relative=True)) ==
                 sorted(rlocs_lst))
+
+
+def test__data_series__create_after_remove():
+    """ test that DataSeries.create recreates directories removed elsewhere
+    """
+    prefix = os.path.join(PREFIX, 'create_after_remove')
+    os.mkdir(prefix)
+
+    ds_ = root_data_series(prefix)
+    locs = [1, 'a']
+
+    # removed by another manager for the same prefix
+    other_ds = root_data_series(prefix)
+    other_ds.removable = True
+
+    ds_.create(locs)
+    other_ds.remove(locs)
+    assert not ds_.exists(locs)
+    ds_.create(locs)
+    assert ds_.exists(locs)
+    assert ds_.existing() == ([1, 'a'],)
+
+    # removed outside of autofile altogether
+    shutil.rmtree(ds_.path(locs))
+    assert not ds_.exists(locs)
+    ds_.create(locs)
+    assert ds_.exists(locs)
+    assert ds_.existing() == ([1, 'a'],)
+
+
+def test__data_series__existing_bad_formats():
+    """ test that DataSeries.existing skips or raises on bad locator files
+    """
+    for bad_str, exception in (('loc2: b\n', KeyError),
+                               ('- [1, 2, 3]\n', ValueError)):
+        prefix = tempfile.mkdtemp(dir=PREFIX)
+        ds_ = root_data_series(prefix)
+        ds_.create([1, 'a'])
+
+        # a directory without a locator file is not a series member
+        os.makedirs(os.path.join(prefix, '2', 'b'))
+        # a directory with an unreadable locator file
+        bad_pth = os.path.join(prefix, '3', 'c')
+        os.makedirs(bad_pth)
+        autofile.io_.write_file(ROOT_SPEC_DFILE.path(bad_pth), bad_str)
+
+        assert ds_.existing() == ([1, 'a'],)
+        with pytest.raises(exception):
+            ds_.existing(ignore_bad_formats=False)
+
+
+def test__data_series__path_cache():
+    """ test the locator-keyed path cache on DataSeries.path
+    """
+    prefix = os.path.join(PREFIX, 'path_cache')
+    os.mkdir(prefix)
+
+    map_calls = []
+
+    def _map(locs):
+        map_calls.append(locs)
+        nums, dct = locs
+        return os.path.join(
+            '_'.join(map(str, nums)),
+            '_'.join(f'{key}{val}' for key, val in sorted(dct.items())))
+
+    ds_ = autofile.model.DataSeries(prefix, map_=_map, nlocs=2, depth=2)
+
+    # equal values of different types map to different paths
+    assert ds_.path([[1], {'R1': 1}]) == os.path.join(ds_.prefix, '1', 'R11')
+    assert (ds_.path([[1.0], {'R1': 1}]) ==
+            os.path.join(ds_.prefix, '1.0', 'R11'))
+
+    # nested lists and dicts go through the cache and come back intact
+    locs = [[1, 2], {'R1': 1.5}]
+    ref_pth = os.path.join(ds_.prefix, _map(locs))
+    ncalls = len(map_calls)
+    assert ds_.path(locs) == ref_pth
+    assert ds_.path([[1, 2], {'R1': 1.5}]) == ref_pth
+    assert len(map_calls) == ncalls + 1
+    assert map_calls[-1] == locs
+    assert isinstance(map_calls[-1][0], list)
+    assert isinstance(map_calls[-1][1], dict)
+
+    # mutating the caller's locators afterwards doesn't touch the cache
+    locs[0].append(3)
+    assert ds_.path(locs) == os.path.join(ds_.prefix, '1_2_3', 'R11.5')
+    assert ds_.path([[1, 2], {'R1': 1.5}]) == ref_pth
+
+    # unhashable locators bypass the cache
+    ncalls = len(map_calls)
+    set_locs = [[1], {'R1': {2}}]
+    assert ds_.path(set_locs) == ds_.path(set_locs)
+    assert len(map_calls) == ncalls + 2
+
+
+def test__data_series__create_after_root_remove():
+    """ test that DataSeries.create restores locator files up the chain
+    """
+    prefix = os.path.join(PREFIX, 'create_after_root_remove')
+    os.mkdir(prefix)
+
+    root_ds = root_data_series(prefix)
+    loc_dfile = autofile.schema.data_files.locator(
+        file_prefix='dir',
+        map_dct_={'loc3': lambda locs: locs[0]},
+        loc_keys=['loc3'],
+    )
+    ds_ = autofile.model.DataSeries(
+        prefix, map_=lambda x: str(x[0]), nlocs=1, depth=1,
+        loc_dfile=loc_dfile, root_ds=root_ds)
+
+    ds_.create([1, 'a', 'z'])
+
+    # removing the root directory and creating a different leaf under it
+    # must rebuild the root's locator file too
+    shutil.rmtree(root_ds.path([1, 'a']))
+    ds_.create([1, 'a', 'y'])
+    assert root_ds.existing() == ([1, 'a'],)
+    assert ds_.existing() == ([1, 'a', 'y'],)
+
+    # likewise when recreating the same leaf
+    shutil.rmtree(root_ds.path([1, 'a']))
+    ds_.create([1, 'a', 'y'])
+    assert root_ds.existing() == ([1, 'a'],)
+    assert ds_.existing() == ([1, 'a', 'y'],)
+
+
+def test__data_series__files():
+    """ test the data files registered on a DataSeries
+    """
+    prefix = os.path.join(PREFIX, 'files')
+    os.mkdir(prefix)
+
+    ds_ = root_data_series(prefix)
+    ds_.add_data_files({'dummy': autofile.model.DataFile('dummy.txt')})
+    ds_.add_data_files({'other': autofile.model.DataFile('other.txt')})
+
+    # data files are registered both by name and as attributes
+    assert ds_.files['dummy'] is ds_.file.dummy
+    assert ds_.files['other'] is ds_.file.other
+
+    # DataSeriesFile is slotted, but removable can still be set
+    ds_.file.dummy.removable = True
+    assert ds_.file.dummy.removable
+    with pytest.raises(AttributeError):
+        ds_.file.dummy.unknown_attribute = True
+
+
+def test__data_series__existing_paths():
+    """ test that DataSeries.existing_paths lists directories without reading
+    """
+    prefix = os.path.join(PREFIX, 'existing_paths')
+    os.mkdir(prefix)
+
+    root_ds = root_data_series(prefix)
+    loc_dfile = autofile.schema.data_files.locator(
+        file_prefix='dir',
+        map_dct_={'loc3': lambda locs: locs[0]},
+        loc_keys=['loc3'],
+    )
+    ds_ = autofile.model.DataSeries(
+        prefix, map_=lambda x: str(x[0]), nlocs=1, depth=1,
+        loc_dfile=loc_dfile, root_ds=root_ds)
+
+    locs_lst = [[1, 'a', 'y'], [1, 'a', 'z'], [2, 'b', 'y']]
+    for locs in locs_lst:
+        ds_.create(locs)
+
+    # a directory without a locator file is listed, but not read
+    no_loc_pth = os.path.join(prefix, '3', 'c')
+    os.makedirs(no_loc_pth)
+
+    root_pths = [root_ds.path(locs[:2]) for locs in locs_lst]
+    assert (sorted(root_ds.existing_paths()) ==
+            sorted(set(root_pths + [no_loc_pth])))
+    assert sorted(root_ds.existing()) == [[1, 'a'], [2, 'b']]
+
+    # partial root locators are filled in from the existing root directories
+    assert (sorted(ds_.existing_paths()) ==
+            sorted(ds_.path(locs) for locs in locs_lst))
+    assert (sorted(ds_.existing_paths([1, 'a'])) ==
+            sorted(ds_.path(locs) for locs in locs_lst[:2]))
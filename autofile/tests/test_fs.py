@@ -416,8 +416,11 @@ def test__build():
 
     ref_inp_str = '<input string>'
     build_fs[-1].create(['MESS', 'C2H5O', 0])
+    assert build_fs[-1].file.input.try_read(['MESS', 'C2H5O', 0]) is None
     build_fs[-1].file.input.write(ref_inp_str, ['MESS', 'C2H5O', 0])
     assert build_fs[-1].file.input.read(['MESS', 'C2H5O', 0]) == ref_inp_str
+    assert (build_fs[-1].file.input.try_read(['MESS', 'C2H5O', 0]) ==
+            ref_inp_str)
 
 
 def test__json_io():
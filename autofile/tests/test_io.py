@@ -0,0 +1,37 @@
+""" test the autofile.io_ module
+"""
+import os
+import tempfile
+import pytest
+import autofile.io_
+
+
+PREFIX = tempfile.mkdtemp()
+
+
+def test__read_write_file():
+    """ test autofile.io_.read_file and autofile.io_.write_file
+    """
+    file_path = os.path.join(PREFIX, 'round_trip.txt')
+
+    # non-ASCII text survives the round trip
+    ref_str = 'InChI=1S/ÅΔ\nλ → μ\n' * 3
+    autofile.io_.write_file(file_path, ref_str)
+    assert autofile.io_.read_file(file_path) == ref_str
+
+    # rewriting truncates the old contents
+    autofile.io_.write_file(file_path, 'short\n')
+    assert autofile.io_.read_file(file_path) == 'short\n'
+
+    # an empty file reads back as an empty string
+    autofile.io_.write_file(file_path, '')
+    assert autofile.io_.read_file(file_path) == ''
+
+    # Windows and old Mac line endings are read as '\n'
+    with open(file_path, mode='wb') as file_obj:
+        file_obj.write(b'a\r\nb\rc\n')
+    assert autofile.io_.read_file(file_path) == 'a\nb\nc\n'
+
+    # a missing file raises, as open() would
+    with pytest.raises(FileNotFoundError):
+        autofile.io_.read_file(os.path.join(PREFIX, 'missing.txt'))